@@ -342,17 +342,9 @@ async function downloadAllAsZip() {
                 throw new Error('Server ZIP creation failed');
             }
             
-            const responseData = await response.json();
-            
-            if (responseData.success && responseData.zip_base64) {
-                // Create a download from the base64 data
-                const binaryString = atob(responseData.zip_base64);
-                const bytes = new Uint8Array(binaryString.length);
-                for (let i = 0; i < binaryString.length; i++) {
-                    bytes[i] = binaryString.charCodeAt(i);
-                }
-                
-                const blob = new Blob([bytes], { type: 'application/zip' });
+            if (response.headers.get('Content-Type') === 'application/zip') {
+                // The server sends the ZIP file as binary data
+                const blob = await response.blob();
                 const downloadLink = document.createElement('a');
                 downloadLink.href = URL.createObjectURL(blob);
                 downloadLink.download = 'pdf_to_json_output.zip';
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+PDF to JSON Converter - ASGI Server
+
+Serves the same web application and /convert endpoint as pdf_converter.py,
+but on an asynchronous ASGI stack (Starlette + uvicorn) so that uploads and
+responses for many clients are handled concurrently while the PDF work runs
+on the shared worker pool.
+
+Usage:
+    pip install starlette python-multipart uvicorn[standard]
+    python asgi_app.py --port 8000
+    # or: uvicorn asgi_app:app --port 8000
+"""
+
+import argparse
+import asyncio
+import io
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import UploadFile
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+
+from pdf_converter import (
+    MAX_UPLOAD_SIZE,
+    PORT,
+    PUBLIC_DIR,
+    gzip_response,
+    json_dumps,
+    json_loads,
+    submit_pdf,
+    valid_zip_items,
+    write_zip_package,
+)
+
+
+def check_content_length(request: Request) -> Optional[Response]:
+    """Return an error response unless the request body has an acceptable declared size."""
+    # A chunked body has no length to check against the upload limit
+    if 'content-length' not in request.headers:
+        return PlainTextResponse('Length Required', status_code=411)
+
+    try:
+        content_length = int(request.headers['content-length'])
+    except ValueError:
+        return PlainTextResponse('Invalid Content-Length', status_code=400)
+
+    # Refuse oversized bodies before buffering any of them
+    if content_length > MAX_UPLOAD_SIZE:
+        return PlainTextResponse('Payload Too Large', status_code=413)
+
+    return None
+
+
+async def convert(request: Request) -> Response:
+    """Handle POST /convert - process uploaded PDFs or package results as a ZIP."""
+    content_type = request.headers.get('content-type', '')
+
+    if content_type.startswith('multipart/form-data'):
+        error = check_content_length(request)
+        if error is not None:
+            return error
+
+        jobs: List[Tuple[str, Union[asyncio.Future, Exception]]] = []
+
+        async with request.form() as form:
+            for fileitem in form.getlist('files[]'):
+                if isinstance(fileitem, UploadFile) and fileitem.filename:
+                    try:
+                        # Process the PDF in the background while the next file is read
+                        file_data = await fileitem.read()
+                        # Hashing and dispatching a large upload must not block the event loop
+                        future = await run_in_threadpool(submit_pdf, file_data, fileitem.filename)
+                        jobs.append((fileitem.filename, asyncio.wrap_future(future)))
+                    except Exception as e:
+                        jobs.append((fileitem.filename, e))
+
+        # Collect the results in upload order
+        results = []
+        for filename, job in jobs:
+            try:
+                if isinstance(job, Exception):
+                    raise job
+                results.append(await job)
+            except Exception as e:
+                results.append({
+                    'filename': filename,
+                    'success': False,
+                    'error': str(e)
+                })
+
+        body, compressed = gzip_response(json_dumps(results), request.headers.get('accept-encoding', ''))
+        headers = {'Vary': 'Accept-Encoding'}
+        if compressed:
+            headers['Content-Encoding'] = 'gzip'
+
+        return Response(body, media_type='application/json', headers=headers)
+
+    if content_type.startswith('application/json'):
+        error = check_content_length(request)
+        if error is not None:
+            return error
+
+        try:
+            payload = json_loads(await request.body())
+        except ValueError:
+            return PlainTextResponse('Invalid JSON', status_code=400)
+
+        if isinstance(payload, dict) and payload.get('action') == 'download_all':
+            json_data_list = payload.get('json_data', [])
+            if not valid_zip_items(json_data_list):
+                return PlainTextResponse('Invalid json_data', status_code=400)
+
+            zip_buffer = io.BytesIO()
+            await run_in_threadpool(write_zip_package, json_data_list, zip_buffer)
+
+            return Response(
+                zip_buffer.getvalue(),
+                media_type='application/zip',
+                headers={'Content-Disposition': 'attachment; filename="pdf_to_json_output.zip"'}
+            )
+
+    return PlainTextResponse('Not Found', status_code=404)
+
+
+app = Starlette(
+    routes=[
+        Route('/convert', convert, methods=['POST']),
+        Mount('/', StaticFiles(directory=PUBLIC_DIR, html=True)),
+    ],
+    middleware=[
+        Middleware(
+            CORSMiddleware,
+            allow_origins=['*'],
+            allow_methods=['POST', 'OPTIONS'],
+            allow_headers=['Content-Type'],
+            max_age=86400,
+        ),
+    ],
+)
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description='Run the PDF to JSON converter on uvicorn.')
+    parser.add_argument('--host', default='0.0.0.0', help='Interface to bind to')
+    parser.add_argument('--port', type=int, default=PORT, help='Port to listen on')
+    # PDF conversion already uses every core through the worker pool, so a
+    # single event loop process is usually enough
+    parser.add_argument('--workers', type=int, default=1, help='Number of server processes')
+    args = parser.parse_args()
+
+    uvicorn.run(
+        'asgi_app:app',
+        app_dir=str(Path(__file__).resolve().parent),
+        host=args.host,
+        port=args.port,
+        workers=args.workers
+    )